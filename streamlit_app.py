@@ -1,9 +1,30 @@
 import os
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait
 import streamlit as st
-# from google import genai # No longer need this top-level import
 import google.generativeai as genai # Correct import
 from google.generativeai import types # This is fine, but GenerationConfig is directly under genai
+from typing_extensions import TypedDict # The SDK's schema conversion documents typing_extensions
+
+try:
+    import orjson # Optional: faster drop-in for json.loads; needs bytes input
+    _loads = orjson.loads
+    _encode = True
+except ImportError:
+    _loads = json.loads
+    _encode = False
+
+try:
+    import ijson # Optional: incremental JSON parsing of the streamed response
+except ImportError:
+    ijson = None
+if ijson is not None and ijson.backend != "yajl2_c":
+    # The pure-Python backends are slower per chunk than one json.loads of the buffer
+    ijson = None
+
+# Must be the first Streamlit command, ahead of the API key check below
+st.set_page_config(page_title="AI-Powered Adaptive Quiz", layout="centered")
 
 # ——————————————————————————
 # Configuration
@@ -16,34 +37,88 @@ if not api_key:
     st.error("🚨 GEMINI_API_KEY environment variable not set! Please set it and restart.")
     st.stop()
 
-try:
-    genai.configure(api_key=api_key)
-except Exception as e:
-    st.error(f"🚨 Error configuring Gemini API: {e}")
-    st.stop()
-
-
 MODEL_NAME = "gemini-1.5-pro-latest" # Using gemini-1.5-pro-latest as it's a common good model, 2.5 isn't widely available
 # If "gemini-2.5-pro-preview-05-06" is specifically what you have access to and want to use, keep it.
 # Otherwise, "gemini-1.5-pro-latest" or "gemini-1.5-flash-latest" are good general choices.
 
-model = genai.GenerativeModel(MODEL_NAME)
+# Configure the SDK and build the client once per process; Streamlit hands the same
+# object to every rerun and session instead of re-creating it on each widget change.
+# A tiny count_tokens request opens the HTTPS connection up front, so the first
+# Generate click doesn't also pay for the TLS handshake.
+@st.cache_resource
+def get_model():
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+    model = genai.GenerativeModel(MODEL_NAME)
+    try:
+        model.count_tokens("hi")
+    except Exception:
+        pass # Warmup is best-effort; real errors surface on the actual request
+    return model
+
+# Prompt templates, joined once at import time and filled in with str.format per call
+_PROMPT_TMPL = (
+    "Generate {n} quiz questions on the topic '{t}', "
+    "at difficulty level {d}/10. "
+    "Respond ONLY with a valid JSON array format, where each element is an object "
+    "with keys 'question' (string) and 'answer' (string). Do not include any other text, "
+    "markdown formatting, or explanations outside the JSON array."
+)
+_BANK_PROMPT_TMPL = (
+    "Generate {n} quiz questions on the topic '{t}' "
+    "for each difficulty level from 1 to 10 (1 = easiest, 10 = hardest). "
+    "Respond ONLY with a valid JSON object whose keys are the difficulty levels "
+    "\"1\" through \"10\" and whose values are arrays of objects with keys "
+    "'question' (string) and 'answer' (string). Do not include any other text, "
+    "markdown formatting, or explanations outside the JSON object."
+)
+
+# Response schemas: Gemini uses these for constrained decoding, so the streamed
+# JSON always has the expected shape instead of occasionally failing to parse
+QA = TypedDict("QA", {"question": str, "answer": str})
+QuestionBank = TypedDict("QuestionBank", {str(level): list[QA] for level in range(1, 11)})
+
+def is_valid_question(item) -> bool:
+    return isinstance(item, dict) and "question" in item and "answer" in item
+
+
+def _salvage_questions(text: str):
+    """
+    Recover the complete question objects from the start of a truncated JSON array,
+    e.g. when the stream was cut off mid-response. Returns a (possibly empty) list.
+    """
+    decoder = json.JSONDecoder()
+    questions = []
+    pos = text.find("[") + 1
+    if pos == 0:
+        return questions
+    while True:
+        # raw_decode doesn't skip leading whitespace, so step over it and the separators
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        if not is_valid_question(item):
+            break
+        questions.append(item)
+    return questions
 
 # ——————————————————————————
 # AI-powered question generation using latest Gemini streaming API
 # ——————————————————————————
-def generate_questions(topic: str, difficulty: int, n_questions: int = 5):
+# Cached on (topic, difficulty, n_questions) so repeat clicks skip the API round-trip.
+# Errors are returned rather than rendered here so the wrapper below can show them
+# and evict the failed entry. The leading underscore keeps _on_question out of the key.
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _fetch_questions_cached(topic: str, difficulty: int, n_questions: int, _on_question=None):
     """
     Generate a JSON array of quiz questions with answers using Gemini streaming.
-    Returns a list of dicts: [{"question": str, "answer": str}, …].
-    """
-    prompt_text = (
-        f"Generate {n_questions} quiz questions on the topic '{topic}', "
-        f"at difficulty level {difficulty}/10. "
-        "Respond ONLY with a valid JSON array format, where each element is an object "
-        "with keys 'question' (string) and 'answer' (string). Do not include any other text, "
-        "markdown formatting, or explanations outside the JSON array."
-    )
+    Returns a tuple (questions, error): questions is a list of dicts
+    [{"question": str, "answer": str}, …] and error is a message string or None.
+    If given, _on_question(item) is called for each question as soon as it is parsed.
+    """
+    prompt_text = _PROMPT_TMPL.format(n=n_questions, t=topic, d=difficulty)
     contents = [
         # types.Content( # This structure is more for chat history
         #     role="user",
@@ -54,12 +129,22 @@ def generate_questions(topic: str, difficulty: int, n_questions: int = 5):
     # Forcing JSON output is generally better via GenerationConfig
     generation_config = genai.types.GenerationConfig(
         response_mime_type="application/json",
+        response_schema=list[QA],
         # temperature=0.7 # Optional: control creativity
     )
 
-    # Stream and accumulate chunks
+    # Stream the response, feeding each chunk to the incremental parser so array
+    # elements are decoded as soon as they are complete instead of after the last byte.
+    # The raw text is still kept for error messages and the json.loads fallback.
+    parts = []
+    questions = []
+    parser = None
+    if ijson is not None:
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "item")
     full_response = ""
     try:
+        model = get_model()
         # Use model.generate_content with stream=True
         response_stream = model.generate_content(
             contents=contents,
@@ -68,43 +153,256 @@ def generate_questions(topic: str, difficulty: int, n_questions: int = 5):
         )
         for chunk in response_stream:
             # When response_mime_type="application/json", chunk.text should contain the JSON string directly
-            if chunk.text: # Ensure text part exists
-                 full_response += chunk.text
+            # .text (and .parts) raise ValueError on chunks with no candidates or no parts, e.g.
+            # metadata-only or trailing finish-reason chunks, so only read it when text is there
+            text = chunk.text if chunk.candidates and chunk.candidates[0].content.parts else ""
+            parts.append(text)
+            if parser is not None and text: # ijson treats empty input as end of stream
+                try:
+                    parser.send(text.encode())
+                except ijson.JSONError:
+                    parser = None # Malformed stream; json.loads below reports the error
+                else:
+                    for item in parsed:
+                        questions.append(item)
+                        if _on_question is not None and is_valid_question(item):
+                            _on_question(item)
+                    del parsed[:]
+        full_response = "".join(parts)
 
     except Exception as e:
-        st.error(f"Error during API call: {e}")
-        st.error(f"Prompt sent: {prompt_text}") # Log the prompt for debugging
+        error = f"Error during API call: {e}\n\nPrompt sent: {prompt_text}" # Log the prompt for debugging
         # It's also good to see what, if anything, was received before the error
         if hasattr(e, 'response') and hasattr(e.response, 'prompt_feedback'):
-             st.error(f"Prompt Feedback: {e.response.prompt_feedback}")
+            error += f"\n\nPrompt Feedback: {e.response.prompt_feedback}"
+        full_response = "".join(parts)
         if full_response:
-            st.warning(f"Partial response received before error: {full_response}")
-        return []
+            error += f"\n\nPartial response received before error: {full_response}"
+        # Keep whatever complete questions arrived before the stream broke
+        salvaged = _salvage_questions(full_response)
+        if salvaged:
+            error += f"\n\nKept the {len(salvaged)} complete question(s) received before the error."
+        return salvaged, error
+
+    if parser is not None:
+        try:
+            parser.close()
+        except ijson.JSONError:
+            parser = None
 
     try:
         # st.write("Raw response from API:", full_response) # For debugging
-        questions = json.loads(full_response)
+        # Fall back to a full parse when ijson is unavailable or failed, and when it
+        # found no array elements (so a non-array response is still reported below)
+        if parser is None or not questions:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+            questions = _loads(full_response.encode() if _encode else full_response)
         # Basic validation of the received structure
         if not isinstance(questions, list):
-            st.error(f"Expected a JSON array, but got type: {type(questions)}. Response:\n{full_response}")
-            return []
+            return [], f"Expected a JSON array, but got type: {type(questions)}. Response:\n{full_response}"
         for item in questions:
-            if not (isinstance(item, dict) and "question" in item and "answer" in item):
-                st.error(f"Invalid item format in JSON array. Item: {item}. Full Response:\n{full_response}")
-                return []
+            if not is_valid_question(item):
+                return [], f"Invalid item format in JSON array. Item: {item}. Full Response:\n{full_response}"
     except json.JSONDecodeError:
-        st.error("Failed to parse questions JSON. Response was:\n" + full_response)
-        return []
+        salvaged = _salvage_questions(full_response)
+        if salvaged:
+            return salvaged, (
+                f"The response was cut off; kept the {len(salvaged)} complete question(s). "
+                "Response was:\n" + full_response
+            )
+        return [], "Failed to parse questions JSON. Response was:\n" + full_response
     except Exception as e: # Catch other potential errors during parsing/validation
-        st.error(f"An unexpected error occurred while processing the response: {e}\nResponse:\n{full_response}")
-        return []
+        return [], f"An unexpected error occurred while processing the response: {e}\nResponse:\n{full_response}"
+    return questions, None
+
+
+# The Gemini call runs on a worker thread so the script thread can keep rerunning
+# (progress, widgets) instead of blocking until the stream closes.
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def generate_questions(topic: str, difficulty: int, n_questions: int = 5, on_question=None):
+    """
+    Submit question generation to the background pool.
+    Returns a Future resolving to the cached fetch's (questions, error) tuple.
+    on_question is called from the worker thread for each question as it is parsed,
+    so it must not call st.* itself.
+    """
+    return get_executor().submit(
+        _fetch_questions_cached, topic, difficulty, n_questions, _on_question=on_question
+    )
+
+
+def finish_generation(future, topic: str, difficulty: int, n_questions: int):
+    """
+    Collect a finished generation future, rendering any error in the UI.
+    Returns a list of dicts: [{"question": str, "answer": str}, …], which may be
+    the questions salvaged from a partial response when an error is reported.
+    """
+    questions, error = future.result()
+    if error:
+        st.error(error)
+        # Don't keep failures around: the next click should hit the API again
+        _fetch_questions_cached.clear(topic, difficulty, n_questions)
     return questions
 
+# One request covering every difficulty level, so later slider changes are served
+# locally instead of each costing a Gemini round-trip. Persisted to disk so the
+# bank survives restarts and is shared across sessions.
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)
+def _fetch_question_bank_cached(topic: str, n_per_difficulty: int):
+    """
+    Generate n_per_difficulty questions for each difficulty level 1–10 in one call.
+    Returns a tuple (bank, error): bank maps difficulty (int) to a list of
+    {"question": str, "answer": str} dicts, and error is a message string or None.
+    """
+    prompt_text = _BANK_PROMPT_TMPL.format(n=n_per_difficulty, t=topic)
+    generation_config = genai.types.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=QuestionBank,
+    )
+    try:
+        response = get_model().generate_content(
+            contents=[prompt_text],
+            generation_config=generation_config,
+        )
+        full_response = response.text
+    except Exception as e:
+        return {}, f"Error during API call: {e}\n\nPrompt sent: {prompt_text}"
+
+    try:
+        raw_bank = _loads(full_response.encode() if _encode else full_response)
+        if not isinstance(raw_bank, dict):
+            return {}, f"Expected a JSON object, but got type: {type(raw_bank)}. Response:\n{full_response}"
+        bank = {}
+        for level, items in raw_bank.items():
+            if not (isinstance(items, list) and all(is_valid_question(item) for item in items)):
+                return {}, f"Invalid questions for difficulty {level}. Full Response:\n{full_response}"
+            bank[int(level)] = items
+    except json.JSONDecodeError:
+        return {}, "Failed to parse question bank JSON. Response was:\n" + full_response
+    except Exception as e: # Catch other potential errors during parsing/validation
+        return {}, f"An unexpected error occurred while processing the response: {e}\nResponse:\n{full_response}"
+    return bank, None
+
+
+# Upper bound on questions per level in a bank: all ten levels come back in one
+# non-streamed response, which must stay well under the model's output-token limit
+BANK_MAX_PER_DIFFICULTY = 5
+
+
+def generate_question_bank(topic: str, n_per_difficulty: int = 3):
+    """
+    Submit question bank generation for all difficulty levels to the background pool.
+    Returns a Future resolving to the cached fetch's (bank, error) tuple.
+    """
+    return get_executor().submit(_fetch_question_bank_cached, topic, n_per_difficulty)
+
+
+def finish_question_bank(future, topic: str, n_per_difficulty: int):
+    """
+    Collect a finished question bank future, rendering any error in the UI.
+    Returns a dict mapping difficulty (int) to a list of {"question", "answer"} dicts.
+    """
+    bank, error = future.result()
+    if error:
+        st.error(error)
+        _fetch_question_bank_cached.clear(topic, n_per_difficulty)
+    return bank
+
+
+def banked_questions(banks, topic: str, difficulty: int, n_questions: int):
+    """
+    Look up n_questions prefetched questions for topic at difficulty.
+    banks maps (topic, n_per_difficulty) to a bank; returns a list, or None when
+    no bank for the topic holds enough questions at that level.
+    """
+    for (bank_topic, _), bank in banks.items():
+        questions = bank.get(difficulty, [])
+        if bank_topic == topic and len(questions) >= n_questions:
+            return questions[:n_questions]
+    return None
+
+
+# Each question is its own fragment: clicking Know / Don't Know reruns only that
+# question instead of the whole script and every other expander.
+@st.fragment
+def render_question(idx, qa):
+    # Keyed on the question text, so keys stay stable for the same question and
+    # don't collide with a different question in the same slot
+    qid = hashlib.sha1(str(qa["question"]).encode()).hexdigest()[:12]
+    exp = st.expander(f"Q{idx}: {qa['question']}")
+    with exp: # Buttons and info should be within the expander's context
+        col1, col2 = st.columns(2)
+        # These buttons don't really "do" much yet other than display a message.
+        # For true interactivity (like tracking score), you'd need more session state.
+        if col1.button("✅ Know", key=f"know_{idx}_{qid}"):
+            st.success("Great! Marked as 'Known'.") # Message inside expander
+        if col2.button("❌ Don't Know", key=f"dontknow_{idx}_{qid}"):
+            st.info(f"**Answer:** {qa['answer']}") # Message inside expander
+
+
+# Runs as an on_click callback: widget-bound keys like "topic" can only be
+# changed before the widgets are created in the next run
+def reset_quiz():
+    st.session_state.quiz_generated = False
+    st.session_state.quiz_questions = []
+    st.session_state.topic = "Photosynthesis" # Reset to default or last
+
+# Runs before the buttons are drawn, so their disabled state matches whether a
+# request is still running, and again right after a submit for fast results
+def collect_finished_requests():
+    pending = st.session_state.get("pending")
+    if pending is not None and pending["future"].done():
+        del st.session_state.pending
+        st.session_state.quiz_questions = finish_generation(pending["future"], *pending["args"])
+        st.session_state.quiz_generated = True # Mark that quiz has been generated
+    pending_bank = st.session_state.get("pending_bank")
+    if pending_bank is not None and pending_bank["future"].done():
+        del st.session_state.pending_bank
+        bank = finish_question_bank(pending_bank["future"], *pending_bank["args"])
+        if bank:
+            st.session_state.bank[pending_bank["args"]] = bank
+            if banked_questions(st.session_state.bank, st.session_state.topic,
+                                st.session_state.difficulty, st.session_state.n_q) is not None:
+                st.success("Question bank ready: changing the difficulty now reuses it without a new request.")
+            else:
+                st.warning(
+                    f"Question bank saved with up to {pending_bank['args'][1]} questions per level; "
+                    "that isn't enough for the current settings, so Generate will make a live request."
+                )
+
+
+# Polls the running request on its own timer, so only this block reruns while
+# waiting; a single full rerun once the request is done picks up the result
+@st.fragment(run_every="0.5s")
+def show_request_progress():
+    pending = st.session_state.get("pending") or st.session_state.get("pending_bank")
+    if pending is None:
+        return
+    if pending["future"].done():
+        st.rerun()
+    if "pending_bank" in st.session_state:
+        topic, n_per_difficulty = pending["args"]
+        st.info(f"Building a question bank for '{topic}' ({n_per_difficulty} per difficulty level 1–10)…")
+        return
+    topic, difficulty, n_q = pending["args"]
+    # Show each question as soon as it has streamed in. The preview is read-only
+    # (no buttons, to avoid duplicate widget keys) and is replaced by the full quiz when done.
+    streamed = list(pending["streamed"])
+    st.progress(
+        min(len(streamed) / n_q, 1.0),
+        text=f"Generating {n_q} questions on '{topic}' (difficulty {difficulty}/10)…"
+    )
+    for idx, qa in enumerate(streamed, start=1):
+        with st.expander(f"Q{idx}: {qa['question']}"):
+            st.caption("Still generating the remaining questions…")
+
 # ——————————————————————————
 # Streamlit UI
 # ——————————————————————————
-st.set_page_config(page_title="AI-Powered Adaptive Quiz", layout="centered")
-
 st.title("🧠 AI-Powered Quiz Prototype") # Removed "Adaptive" until implemented
 st.markdown(
     """
@@ -118,67 +416,101 @@ if "quiz_generated" not in st.session_state:
     st.session_state.quiz_generated = False
 if "quiz_questions" not in st.session_state:
     st.session_state.quiz_questions = []
-if "topic" not in st.session_state: # Persist topic input
-    st.session_state.topic = "Photosynthesis"
-if "difficulty" not in st.session_state: # Persist difficulty
-    st.session_state.difficulty = 5
-if "n_q" not in st.session_state: # Persist num questions
-    st.session_state.n_q = 5
+# Widget defaults; the widgets below are bound to these keys directly
+st.session_state.setdefault("topic", "Photosynthesis")
+st.session_state.setdefault("difficulty", 5)
+st.session_state.setdefault("n_q", 5)
+if "bank" not in st.session_state: # Prefetched questions: (topic, n) -> {difficulty: [qa, …]}
+    st.session_state.bank = {}
+if "warmed_up" not in st.session_state: # Build and warm the client off the script thread
+    get_executor().submit(get_model)
+    st.session_state.warmed_up = True
 
 # User inputs
-# Use session state to keep input values sticky across reruns if desired
-st.session_state.topic = st.text_input(
+# Bound to session state via key=, so values stay sticky across reruns
+st.text_input(
     "Topic",
-    value=st.session_state.topic,
+    key="topic",
     placeholder="e.g. Photosynthesis, Python decorators…"
 )
-st.session_state.difficulty = st.slider(
+st.slider(
     "Difficulty level",
     min_value=1,
     max_value=10,
-    value=st.session_state.difficulty
+    key="difficulty"
 )
-st.session_state.n_q = st.number_input(
+st.number_input(
     "Number of questions",
     min_value=1,
     max_value=20, # Increased max a bit
-    value=st.session_state.n_q
+    key="n_q"
 )
 
-if st.button("✨ Generate Questions"):
+collect_finished_requests()
+
+# Only one background request at a time, so a single progress fragment below is active
+busy = "pending" in st.session_state or "pending_bank" in st.session_state
+col_generate, col_bank = st.columns(2)
+generate_clicked = col_generate.button("✨ Generate Questions", disabled=busy)
+if col_bank.button("📚 Prefetch all difficulty levels", disabled=busy):
     if not st.session_state.topic.strip():
         st.warning("Please enter a topic.")
     else:
-        with st.spinner(f"Generating {st.session_state.n_q} questions on '{st.session_state.topic}' (difficulty {st.session_state.difficulty}/10)…"):
-            st.session_state.quiz_questions = generate_questions(
-                st.session_state.topic,
-                st.session_state.difficulty,
-                st.session_state.n_q
-            )
-            st.session_state.quiz_generated = True # Mark that quiz has been generated
+        # Sized to the current question count (capped) so Generate can serve it from the
+        # bank; larger counts fall back to a live request
+        args = (st.session_state.topic, min(st.session_state.n_q, BANK_MAX_PER_DIFFICULTY))
+        future = generate_question_bank(*args)
+        st.session_state.pending_bank = {
+            "future": future,
+            "args": args,
+        }
+        # Same as Generate below: cached banks are finalized in this run
+        wait([future], timeout=0.1)
+        collect_finished_requests()
+        if "pending_bank" in st.session_state:
+            st.rerun() # Redraw with the buttons disabled while the bank is built
+
+if generate_clicked:
+    # Served from the prefetched bank when it already holds enough questions at this level
+    banked = banked_questions(
+        st.session_state.bank, st.session_state.topic, st.session_state.difficulty, st.session_state.n_q
+    )
+    if not st.session_state.topic.strip():
+        st.warning("Please enter a topic.")
+    elif banked is not None:
+        st.session_state.quiz_questions = banked
+        st.session_state.quiz_generated = True
+    else:
+        # The worker appends parsed questions to `streamed`; the progress fragment reads from it
+        args = (st.session_state.topic, st.session_state.difficulty, st.session_state.n_q)
+        streamed = []
+        future = generate_questions(*args, on_question=streamed.append)
+        st.session_state.pending = {
+            "future": future,
+            "streamed": streamed,
+            "args": args,
+        }
+        st.session_state.quiz_generated = False
+        st.session_state.quiz_questions = []
+        # Give fast results (e.g. cache hits) a moment to be finalized in this run
+        wait([future], timeout=0.1)
+        collect_finished_requests()
+        if "pending" in st.session_state:
+            st.rerun() # Redraw with the buttons disabled while the request runs
+
+if "pending" in st.session_state or "pending_bank" in st.session_state:
+    show_request_progress()
 
 if st.session_state.quiz_generated:
     if st.session_state.quiz_questions:
         st.success(f"Generated {len(st.session_state.quiz_questions)} questions!")
         for idx, qa in enumerate(st.session_state.quiz_questions, start=1):
             # Ensure qa is a dict and has the keys, robust error handling
-            if isinstance(qa, dict) and "question" in qa and "answer" in qa:
-                exp = st.expander(f"Q{idx}: {qa['question']}")
-                with exp: # Buttons and info should be within the expander's context
-                    col1, col2 = st.columns(2)
-                    # These buttons don't really "do" much yet other than display a message.
-                    # For true interactivity (like tracking score), you'd need more session state.
-                    if col1.button("✅ Know", key=f"know_{st.session_state.topic}_{idx}"): # Make key more unique
-                        st.success("Great! Marked as 'Known'.") # Message inside expander
-                    if col2.button("❌ Don't Know", key=f"dontknow_{st.session_state.topic}_{idx}"): # Make key more unique
-                        st.info(f"**Answer:** {qa['answer']}") # Message inside expander
+            if is_valid_question(qa):
+                render_question(idx, qa)
             else:
                 st.warning(f"Question {idx} has an invalid format: {qa}")
-        if st.button("Reset Quiz", key="reset_quiz"):
-            st.session_state.quiz_generated = False
-            st.session_state.quiz_questions = []
-            st.session_state.topic = "Photosynthesis" # Reset to default or last
-            st.rerun()
+        st.button("Reset Quiz", key="reset_quiz", on_click=reset_quiz)
 
     elif st.session_state.quiz_generated: # If generated flag is true but no questions
         st.error("No questions were generated. Try again with a different topic or difficulty, or check the logs if errors appeared above.")